@@ -1,18 +1,35 @@
 import argparse
+import heapq
 import os
-from dataclasses import dataclass
+import re
+import sys
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from enum import IntEnum
+from functools import lru_cache
+from itertools import repeat
+from typing import DefaultDict, Dict, FrozenSet, Iterable, List, Optional, Tuple, Any, Union
 
+import numpy as np
 import pandas as pd
+import xlsxwriter
 from dateutil import tz
 
-# TOML loader: stdlib on 3.11+, fallback to tomli on 3.9/3.10
+# TOML loader: stdlib on 3.11+, fallback to tomli on 3.10
 try:
     import tomllib  # py311+
 except ModuleNotFoundError:
     import tomli as tomllib
 
+# Optional JIT for the start/sit kernel; the NumPy fallback gives the same answers.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from espn_api.football import League, constant
 
 
@@ -20,7 +37,9 @@ from espn_api.football import League, constant
 # Config & IO helpers
 # --------------------------
 
-@dataclass
+# Slotted and frozen: configs are read constantly in the analysis loops and never
+# mutated after load_config().
+@dataclass(slots=True, frozen=True)
 class Config:
     league_id: int
     season_year: int
@@ -31,7 +50,7 @@ class Config:
     out_dir: str
     xlsx_path: str
     start_sit_threshold: float
-    per_pos_thresholds: Dict[str, float]
+    per_pos_thresholds: Dict["PosKey", float]
     lock_positions: List[str]
     free_agent_pool_size: int
     positions: List[str]
@@ -40,22 +59,43 @@ class Config:
     openai_model: str = "gpt-4o-mini"
     pushover_api_token: Optional[str] = None
     pushover_user_key: Optional[str] = None
+    export_format: str = "csv"
+    lockset: FrozenSet["PosKey"] = field(init=False, default=frozenset())
+
+    def __post_init__(self) -> None:
+        # Normalize position keys once here so the analysis code can use plain
+        # dict/set lookups with :func:`_norm_pos` output.
+        object.__setattr__(
+            self, "per_pos_thresholds", {_norm_pos(k): float(v) for k, v in self.per_pos_thresholds.items()}
+        )
+        object.__setattr__(self, "lockset", frozenset(_norm_pos(p) for p in (self.lock_positions or ())))
+
 
+_NUMERIC_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?")
 
-def _as_float_scalar(v: Any, key_path: str = "value") -> float:
+
+def _as_float_scalar(v: Any, key_path: str = "value", key: Any = None) -> float:
     """
     Accept numbers, numeric strings, or single-item lists/tuples of those.
     Raise a friendly error otherwise.
+
+    ``key`` is appended to ``key_path`` in the error message; it is only
+    formatted when a value is rejected.
     """
-    if isinstance(v, (list, tuple)) and v:
-        v = v[0]
-    if isinstance(v, (int, float)):
+    # TOML hands us plain ints and floats almost always; check exact types first.
+    if type(v) is list or type(v) is tuple:
+        if v:
+            v = v[0]
+    if type(v) is float or type(v) is int:
         return float(v)
     if isinstance(v, str):
-        try:
-            return float(v.strip())
-        except ValueError:
-            pass
+        s = v.strip()
+        if _NUMERIC_RE.fullmatch(s):
+            return float(s)
+    elif isinstance(v, (int, float)):  # bools and other numeric subclasses
+        return float(v)
+    if key is not None:
+        key_path = f"{key_path}.{key}"
     raise ValueError(f"{key_path} must be a number (got {type(v).__name__}: {v!r})")
 
 
@@ -75,6 +115,9 @@ def load_config(path: str = "config.toml") -> Config:
 
     out_dir = os.path.expanduser(os.path.expandvars(out.get("dir", "espn_extractor/data")))
     xlsx_path = os.path.expanduser(os.path.expandvars(out.get("xlsx_path", "espn_extractor/data/league_export.xlsx")))
+    export_format = str(out.get("format", "csv")).lower()
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"output.format must be one of {', '.join(EXPORT_FORMATS)} (got {export_format!r})")
 
     return Config(
         league_id=int(league["league_id"]),
@@ -86,7 +129,9 @@ def load_config(path: str = "config.toml") -> Config:
         out_dir=out_dir,
         xlsx_path=xlsx_path,
         start_sit_threshold=_as_float_scalar(advice.get("start_sit_threshold", 1.5), "advice.start_sit_threshold"),
-        per_pos_thresholds={str(k): _as_float_scalar(v, f"advice.per_position_thresholds.{k}") for k, v in per_pos.items()},
+        per_pos_thresholds={
+            str(k): _as_float_scalar(v, "advice.per_position_thresholds", k) for k, v in per_pos.items()
+        },
         lock_positions=[str(p) for p in advice.get("advice_lock_positions", [])],
         free_agent_pool_size=int(advice.get("free_agent_pool_size", 50)),
         positions=list(advice.get("positions", ["QB", "RB", "WR", "TE", "D/ST", "K", "FLEX", "OP"])),
@@ -95,6 +140,7 @@ def load_config(path: str = "config.toml") -> Config:
         openai_model=openai_cfg.get("model", "gpt-4o-mini"),
         pushover_api_token=pushover_cfg.get("api_token"),
         pushover_user_key=pushover_cfg.get("user_key"),
+        export_format=export_format,
     )
 
 
@@ -102,8 +148,28 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+# Data exports can be written as CSV (default; what daily_ai_summary.py reads)
+# or, for programmatic consumers, as Parquet/Feather, which need pyarrow.
+EXPORT_FORMATS: Tuple[str, ...] = ("csv", "parquet", "feather")
+
+
+def _write_table(df: pd.DataFrame, out_dir: str, stem: str, export_format: str = "csv") -> None:
+    """Write ``df`` to ``out_dir/<stem>.<export_format>``."""
+    path = os.path.join(out_dir, f"{stem}.{export_format}")
+    if export_format == "parquet":
+        df.to_parquet(path, compression="zstd", index=False)
+    elif export_format == "feather":
+        df.reset_index(drop=True).to_feather(path)
+    else:
+        df.to_csv(path, index=False)
+
+
+# Eastern Time: ESPN's schedule day boundary.  Resolved once at import.
+_TZ_ET = tz.gettz("America/New_York")
+
+
 def today_et_date_str() -> str:
-    return datetime.now(tz.gettz("America/New_York")).strftime("%Y-%m-%d")
+    return datetime.now(_TZ_ET).strftime("%Y-%m-%d")
 
 
 # --------------------------
@@ -118,30 +184,132 @@ def make_league(cfg: Config) -> League:
     return League(**kwargs)
 
 
+# Box scores are fetched over HTTP and were previously requested again by every
+# exporter and analysis helper.  Cache them per league object and week so a run
+# only pays for one round-trip per week.
+_BOX_SCORE_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_box_scores(league: League, week: Optional[int]) -> List[Any]:
+    """Return ``league.box_scores(week)``, fetching at most once per league/week.
+
+    ``None`` resolves to the league's current week, matching ``espn_api``'s own
+    default, so callers with and without an explicit week share the cache.
+    """
+    week = week or getattr(league, "current_week", None)
+    per_league = _BOX_SCORE_CACHE.setdefault(league, {})
+    if week not in per_league:
+        per_league[week] = league.box_scores(week) if week else league.box_scores()
+    return per_league[week]
+
+
+# Enough to request every standard position's free agents at once.
+_MAX_FETCH_WORKERS = 9
+
+
+def _fetch_free_agents(
+    league: League, pool_size: int, positions: List[str], max_workers: Optional[int] = None
+) -> List[Tuple[str, List[Any]]]:
+    """Fetch free agents for each position concurrently.
+
+    Each ``league.free_agents`` call is a blocking HTTP request, so the lookups
+    run on a small thread pool (``max_workers`` threads, by default one per
+    position up to ``_MAX_FETCH_WORKERS``).  Results keep the order of
+    ``positions``; positions whose lookup fails are left out.
+    """
+
+    def fetch(pos: str) -> Tuple[str, Optional[List[Any]]]:
+        try:
+            return pos, league.free_agents(size=pool_size, position=pos)
+        except Exception:
+            # Some composite slots (e.g., FLEX, OP) may not be directly queryable; ignore gracefully.
+            return pos, None
+
+    if not positions:
+        return []
+    if max_workers is None:
+        max_workers = min(_MAX_FETCH_WORKERS, len(positions))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(fetch, positions))
+    return [(pos, fas) for pos, fas in results if fas is not None]
+
+
+def _proj(p: Any) -> float:
+    """A player's projected points as a float; missing or null projections are 0."""
+    return float(getattr(p, "projected_points", 0) or 0)
+
+
 # --------------------------
 # Exporters
 # --------------------------
 
-def export_standings(league: League, out_dir: str) -> pd.DataFrame:
+# Column order for each export.  Standings and matchups are built as tuples in
+# this order and handed to ``DataFrame.from_records``; player exports fill one
+# list per column (see :func:`_player_columns`) so pandas never has to
+# discover keys or transpose a list of dicts.
+_STANDINGS_COLS: Tuple[str, ...] = (
+    "team_id",
+    "team_name",
+    "wins",
+    "losses",
+    "ties",
+    "points_for",
+    "points_against",
+    "streak_length",
+    "final_standing",
+)
+_MATCHUP_COLS: Tuple[str, ...] = (
+    "week",
+    "home_team_id",
+    "home_team_name",
+    "away_team_id",
+    "away_team_name",
+    "home_score",
+    "away_score",
+    "projected_home",
+    "projected_away",
+)
+_PLAYER_COLS: Tuple[str, ...] = (
+    "week",
+    "on_team_id",
+    "player_id",
+    "name",
+    "position",
+    "slot",
+    "pro_team",
+    "proj_points",
+    "actual_points",
+    "injury_status",
+    "percent_owned",
+    "percent_started",
+    "eligible_slots",
+)
+
+
+def export_standings(league: League, out_dir: str, export_format: str = "csv") -> pd.DataFrame:
     rows = []
     for t in league.teams:
-        rows.append({
-            "team_id": t.team_id,
-            "team_name": t.team_name,
-            "wins": t.wins,
-            "losses": t.losses,
-            "ties": getattr(t, "ties", 0),
-            "points_for": t.points_for,
-            "points_against": t.points_against,
-            "streak_length": getattr(t, "streak_length", None),
-            "final_standing": getattr(t, "final_standing", None),
-        })
-    df = pd.DataFrame(rows).sort_values(["wins", "points_for"], ascending=[False, False]).reset_index(drop=True)
-    df.to_csv(os.path.join(out_dir, "standings.csv"), index=False)
+        rows.append((
+            t.team_id,
+            t.team_name,
+            t.wins,
+            t.losses,
+            getattr(t, "ties", 0),
+            t.points_for,
+            t.points_against,
+            getattr(t, "streak_length", None),
+            getattr(t, "final_standing", None),
+        ))
+    # Best record first, points_for as the tie-breaker.
+    rows.sort(key=lambda r: (-r[2], -r[5]))
+    df = pd.DataFrame.from_records(rows, columns=_STANDINGS_COLS)
+    _write_table(df, out_dir, "standings", export_format)
     return df
 
 
-def export_matchups(league: League, out_dir: str, scoring_period: Optional[int]) -> pd.DataFrame:
+def export_matchups(
+    league: League, out_dir: str, scoring_period: Optional[int], export_format: str = "csv"
+) -> pd.DataFrame:
     """Export matchup information for a given week.
 
     When ``scoring_period`` is ``None`` the ``espn_api`` library returns box
@@ -155,57 +323,107 @@ def export_matchups(league: League, out_dir: str, scoring_period: Optional[int])
     """
 
     week = scoring_period or getattr(league, "current_week", None)
-    box_scores = league.box_scores(week)
+    box_scores = _get_box_scores(league, week)
     rows = []
     for bs in box_scores:
         home_proj = getattr(bs, "home_projected", None)
         if not home_proj:
-            home_proj = sum(float(getattr(p, "projected_points", 0) or 0) for p in (bs.home_lineup or []))
+            home_proj = sum(map(_proj, bs.home_lineup or ()))
         away_proj = getattr(bs, "away_projected", None)
         if not away_proj:
-            away_proj = sum(float(getattr(p, "projected_points", 0) or 0) for p in (bs.away_lineup or []))
-        rows.append({
-            "week": week,
-            "home_team_id": bs.home_team.team_id,
-            "home_team_name": bs.home_team.team_name,
-            "away_team_id": bs.away_team.team_id,
-            "away_team_name": bs.away_team.team_name,
-            "home_score": bs.home_score,
-            "away_score": bs.away_score,
-            "projected_home": float(home_proj),
-            "projected_away": float(away_proj),
-        })
-    df = pd.DataFrame(rows)
-    df.to_csv(os.path.join(out_dir, "current_matchups.csv"), index=False)
+            away_proj = sum(map(_proj, bs.away_lineup or ()))
+        rows.append((
+            week,
+            bs.home_team.team_id,
+            bs.home_team.team_name,
+            bs.away_team.team_id,
+            bs.away_team.team_name,
+            bs.home_score,
+            bs.away_score,
+            float(home_proj),
+            float(away_proj),
+        ))
+    df = pd.DataFrame.from_records(rows, columns=_MATCHUP_COLS)
+    _write_table(df, out_dir, "current_matchups", export_format)
     return df
 
 
-def _player_to_row(p, team_id=None, week=None) -> Dict[str, Any]:
-    # eligibleSlots can be list[str] or list[int] depending on espn_api version; normalize to strings
-    elig = getattr(p, "eligibleSlots", None)
-    if isinstance(elig, list):
-        elig_str = ",".join(str(s) for s in elig)
-    else:
-        elig_str = ""
-
-    return {
-        "week": week,
-        "on_team_id": team_id,
-        "player_id": getattr(p, "playerId", None),
-        "name": getattr(p, "name", None),
-        "position": getattr(p, "position", None),
-        "slot": getattr(p, "slot_position", None),
-        "pro_team": getattr(p, "proTeam", None),
-        "proj_points": float(getattr(p, "projected_points", 0) or 0),
-        "actual_points": float(getattr(p, "points", 0) or 0),
-        "injury_status": getattr(p, "injuryStatus", None) if hasattr(p, "injuryStatus") else None,
-        "percent_owned": getattr(p, "percent_owned", None) if hasattr(p, "percent_owned") else None,
-        "percent_started": getattr(p, "percent_started", None) if hasattr(p, "percent_started") else None,
-        "eligible_slots": elig_str,
-    }
-
-
-def export_rosters(league: League, out_dir: str, scoring_period: Optional[int]) -> pd.DataFrame:
+# Most players share one of a handful of eligibility lists, so stringify each
+# distinct list once.
+@lru_cache(maxsize=256)
+def _elig_str(elig: Tuple[Any, ...]) -> str:
+    return ",".join(map(str, elig))
+
+
+def _player_columns(
+    players: Iterable[Any], team_ids: Iterable[Optional[int]], week: Optional[int], **extra: List[Any]
+) -> Dict[str, List[Any]]:
+    """Read export fields for ``players`` into one list per column.
+
+    ``team_ids`` runs parallel to ``players``.  ``extra`` adds exporter-specific
+    columns (e.g. ``team_name=[...]``) that are already parallel lists; they
+    follow the ``_PLAYER_COLS`` columns in the result.
+    """
+    weeks: List[Any] = []
+    on_team_ids: List[Any] = []
+    player_ids: List[Any] = []
+    names: List[Any] = []
+    positions: List[Any] = []
+    slots: List[Any] = []
+    pro_teams: List[Any] = []
+    proj_points: List[float] = []
+    actual_points: List[float] = []
+    injury_statuses: List[Any] = []
+    percent_owned: List[Any] = []
+    percent_started: List[Any] = []
+    eligible_slots: List[str] = []
+
+    for p, team_id in zip(players, team_ids):
+        # eligibleSlots can be list[str] or list[int] depending on espn_api version; normalize to strings
+        elig = getattr(p, "eligibleSlots", None)
+        weeks.append(week)
+        on_team_ids.append(team_id)
+        player_ids.append(getattr(p, "playerId", None))
+        names.append(getattr(p, "name", None))
+        positions.append(getattr(p, "position", None))
+        slots.append(getattr(p, "slot_position", None))
+        pro_teams.append(getattr(p, "proTeam", None))
+        proj_points.append(_proj(p))
+        actual_points.append(float(getattr(p, "points", 0) or 0))
+        injury_statuses.append(getattr(p, "injuryStatus", None))
+        percent_owned.append(getattr(p, "percent_owned", None))
+        percent_started.append(getattr(p, "percent_started", None))
+        eligible_slots.append(_elig_str(tuple(elig)) if isinstance(elig, list) else "")
+
+    cols = dict(zip(_PLAYER_COLS, (
+        weeks,
+        on_team_ids,
+        player_ids,
+        names,
+        positions,
+        slots,
+        pro_teams,
+        proj_points,
+        actual_points,
+        injury_statuses,
+        percent_owned,
+        percent_started,
+        eligible_slots,
+    )))
+    cols.update(extra)
+    return cols
+
+
+def _players_to_frame(
+    players: Iterable[Any], team_ids: Iterable[Optional[int]], week: Optional[int], **extra: List[Any]
+) -> pd.DataFrame:
+    """Build a player export frame column-wise; see :func:`_player_columns`."""
+    return pd.DataFrame(_player_columns(players, team_ids, week, **extra), copy=False)
+
+
+def export_rosters(
+    league: League, out_dir: str, scoring_period: Optional[int], export_format: str = "csv"
+) -> pd.DataFrame:
     """Export roster information for each team for a specific week.
 
     Similar to :func:`export_matchups`, we need the correct week value even
@@ -216,26 +434,25 @@ def export_rosters(league: League, out_dir: str, scoring_period: Optional[int])
     """
 
     week = scoring_period or getattr(league, "current_week", None)
-    rows = []
-    bs_list = league.box_scores(week)
+    players: List[Any] = []
+    team_ids: List[int] = []
+    index = _get_lineup_index(league, week)
     for team in league.teams:
-        bs_for_team = next(
-            (bs for bs in bs_list if bs.home_team.team_id == team.team_id or bs.away_team.team_id == team.team_id),
-            None,
-        )
-        if bs_for_team:
+        entry = index.get(team.team_id)
+        if entry:
+            bs_for_team = entry[2]
             lineup = bs_for_team.home_lineup if bs_for_team.home_team.team_id == team.team_id else bs_for_team.away_lineup
-            for p in (lineup or []):
-                rows.append(_player_to_row(p, team_id=team.team_id, week=week))
         else:
-            for p in team.roster:
-                rows.append(_player_to_row(p, team_id=team.team_id, week=week))
-    df = pd.DataFrame(rows)
-    df.to_csv(os.path.join(out_dir, "current_rosters.csv"), index=False)
+            lineup = team.roster
+        lineup = list(lineup or [])
+        players.extend(lineup)
+        team_ids.extend([team.team_id] * len(lineup))
+    df = _players_to_frame(players, team_ids, week)
+    _write_table(df, out_dir, "current_rosters", export_format)
     return df
 
 
-def export_current_team_rosters(league: League, out_dir: str) -> pd.DataFrame:
+def export_current_team_rosters(league: League, out_dir: str, export_format: str = "csv") -> pd.DataFrame:
     """Export the current roster (starters and bench) for every team.
 
     ``League`` does not expose slot information for bench players via
@@ -246,93 +463,116 @@ def export_current_team_rosters(league: League, out_dir: str) -> pd.DataFrame:
     """
 
     week = getattr(league, "current_week", None)
-    rows: List[Dict[str, Any]] = []
+    players: List[Any] = []
+    team_ids: List[int] = []
+    team_names: List[str] = []
+    is_starter: List[bool] = []
     for team in league.teams:
         starters, bench = _lineup_for_team(league, team.team_id, None)
-        for player in starters + bench:
-            rows.append(
-                _player_to_row(player, team_id=team.team_id, week=week)
-                | {
-                    "team_name": team.team_name,
-                    "is_starter": player in starters,
-                }
-            )
-    df = pd.DataFrame(rows)
-    df.to_csv(os.path.join(out_dir, "current_team_rosters.csv"), index=False)
+        n = len(starters) + len(bench)
+        players.extend(starters)
+        players.extend(bench)
+        team_ids.extend([team.team_id] * n)
+        team_names.extend([team.team_name] * n)
+        is_starter.extend([True] * len(starters))
+        is_starter.extend([False] * len(bench))
+    df = _players_to_frame(players, team_ids, week, team_name=team_names, is_starter=is_starter)
+    _write_table(df, out_dir, "current_team_rosters", export_format)
     return df
 
 
-def export_free_agents(league: League, out_dir: str, pool_size: int, positions: List[str]) -> pd.DataFrame:
+def export_free_agents(
+    league: League,
+    out_dir: str,
+    pool_size: int,
+    positions: List[str],
+    export_format: str = "csv",
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
     """Export information on free agents for the provided positions.
 
     The previous implementation left the "week" column empty.  We now populate
     it using the league's current week so downstream consumers know when the
-    snapshot was taken.
+    snapshot was taken.  Positions are fetched concurrently; ``max_workers``
+    caps the thread pool (default: one thread per position, at most
+    ``_MAX_FETCH_WORKERS``).
     """
 
     week = getattr(league, "current_week", None)
-    rows = []
-    for pos in positions:
-        try:
-            for p in league.free_agents(size=pool_size, position=pos):
-                rows.append(_player_to_row(p, team_id=None, week=week) | {"fa_position": pos})
-        except Exception:
-            # Some composite slots (e.g., FLEX, OP) may not be directly queryable; ignore gracefully.
-            continue
-    df = pd.DataFrame(rows).drop_duplicates(subset=["player_id"])
-    df.to_csv(os.path.join(out_dir, "free_agents.csv"), index=False)
+    players: List[Any] = []
+    fa_positions: List[str] = []
+    # Composite slots (FLEX, OP) repeat players already seen under their own
+    # position; keep only the first occurrence of each player.
+    seen: set = set()
+    for pos, fas in _fetch_free_agents(league, pool_size, positions, max_workers):
+        for p in fas:
+            pid = getattr(p, "playerId", None)
+            if pid in seen:
+                continue
+            seen.add(pid)
+            players.append(p)
+            fa_positions.append(pos)
+    df = _players_to_frame(players, repeat(None), week, fa_position=fa_positions)
+    _write_table(df, out_dir, "free_agents", export_format)
     return df
 
 
-def export_upcoming_pro_schedule(league: League, out_dir: str) -> pd.DataFrame:
+def export_upcoming_pro_schedule(league: League, out_dir: str, export_format: str = "csv") -> pd.DataFrame:
     """Export today's and future NFL pro games.
 
     The ``espn_api`` schedule repeats games for each team.  We deduplicate using
     ``gameId`` and only keep matchups scheduled for today or later (Eastern
-    Time).  Results are written to ``pro_schedule_upcoming.csv`` in ``out_dir``.
+    Time).  Results are written to ``pro_schedule_upcoming.<export_format>`` in
+    ``out_dir``.
     """
 
-    tz_et = tz.gettz("America/New_York")
-    today = datetime.now(tz_et).date()
+    today = datetime.now(_TZ_ET).date()
     schedule = league._get_all_pro_schedule()
 
-    seen: set[int] = set()
-    rows: List[Dict[str, Any]] = []
+    # Each game is listed once per team.  Identical listings are skipped here;
+    # a game is only deduplicated by id after date filtering, so a listing
+    # with a bad or past date never hides a later valid one.
+    seen: set = set()
+    raw: List[Tuple[Any, ...]] = []
     for team_sched in schedule.values():
         for week, games in (team_sched or {}).items():
             for g in games:
                 game_id = g.get("gameId") or g.get("id")
-                if game_id in seen:
-                    continue
-
                 raw_date = g.get("date") or g.get("gameDate")
-                if isinstance(raw_date, str):
-                    try:
-                        game_dt = datetime.fromisoformat(raw_date.replace("Z", "+00:00")).astimezone(tz_et)
-                    except ValueError:
-                        continue
-                else:
-                    try:
-                        game_dt = datetime.fromtimestamp(float(raw_date) / 1000, tz_et)
-                    except Exception:
-                        continue
+                key = (game_id, raw_date)
+                if key in seen:
+                    continue
+                seen.add(key)
+                raw.append((
+                    int(week),
+                    game_id,
+                    raw_date,
+                    g.get("homeProTeamId"),
+                    g.get("awayProTeamId"),
+                ))
+
+    df = pd.DataFrame.from_records(
+        raw, columns=["week", "game_id", "raw_date", "home_team_id", "away_team_id"]
+    )
 
-                if game_dt.date() >= today:
-                    rows.append(
-                        {
-                            "week": int(week),
-                            "game_id": game_id,
-                            "game_date": game_dt.strftime("%Y-%m-%d"),
-                            "home_team_id": g.get("homeProTeamId"),
-                            "away_team_id": g.get("awayProTeamId"),
-                            "home_team_abbrev": constant.PRO_TEAM_MAP.get(g.get("homeProTeamId")),
-                            "away_team_abbrev": constant.PRO_TEAM_MAP.get(g.get("awayProTeamId")),
-                        }
-                    )
-                    seen.add(game_id)
-
-    df = pd.DataFrame(rows).sort_values(["game_date", "game_id"]).reset_index(drop=True)
-    df.to_csv(os.path.join(out_dir, "pro_schedule_upcoming.csv"), index=False)
+    # Dates arrive either as ISO strings or epoch milliseconds; parse each kind
+    # in one vectorized call.  Unparseable dates become NaT and are dropped by
+    # the date filter below.
+    raw_date = df.pop("raw_date")
+    is_str = raw_date.map(type) == str
+    game_dt = pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns, UTC]")
+    game_dt[is_str] = pd.to_datetime(raw_date[is_str], utc=True, errors="coerce", format="ISO8601")
+    game_dt[~is_str] = pd.to_datetime(pd.to_numeric(raw_date[~is_str], errors="coerce"), unit="ms", utc=True)
+    game_dt = game_dt.dt.tz_convert(_TZ_ET)
+
+    keep = (game_dt.dt.date >= today).to_numpy(dtype=bool)
+    df = df[keep]
+    df.insert(2, "game_date", game_dt[keep].dt.strftime("%Y-%m-%d"))
+    df = df.drop_duplicates("game_id")
+    df["home_team_abbrev"] = df["home_team_id"].map(constant.PRO_TEAM_MAP)
+    df["away_team_abbrev"] = df["away_team_id"].map(constant.PRO_TEAM_MAP)
+    df = df.sort_values(["game_date", "game_id"]).reset_index(drop=True)
+    _write_table(df, out_dir, "pro_schedule_upcoming", export_format)
     return df
 
 
@@ -367,27 +607,118 @@ def export_league_settings(league: League, out_dir: str) -> pd.DataFrame:
 # Analysis (Start/Sit & Trades)
 # --------------------------
 
-def _norm_pos(pos: Optional[str]) -> Optional[str]:
+class Pos(IntEnum):
+    """Fantasy positions used by the analysis code.
+
+    Comparisons and dict lookups in the start/sit and trade loops run on these
+    small ints; ``str(pos)`` gives back the ESPN label for output.  Values start
+    at 1 so every member is truthy.
+    """
+
+    QB = 1
+    RB = 2
+    WR = 3
+    TE = 4
+    DST = 5
+    K = 6
+    FLEX = 7
+    OP = 8
+
+    def __str__(self) -> str:
+        return "D/ST" if self is Pos.DST else self.name
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+
+_STR_TO_POS: Dict[str, Pos] = {str(p): p for p in Pos}
+_STR_TO_POS["DST"] = Pos.DST
+
+# A normalized position: a ``Pos`` for the known vocabulary, otherwise the
+# upper-cased label (IDP and other uncommon slots).
+PosKey = Union[Pos, str]
+
+_TRADE_POSITIONS: Tuple[Pos, ...] = (Pos.RB, Pos.WR, Pos.QB, Pos.TE)
+
+
+# Positions come from a tiny vocabulary but are normalized for every player in
+# every analysis loop; memoize the result.  Labels outside ``Pos`` are interned
+# so repeated set/dict lookups on them compare by identity.
+@lru_cache(maxsize=64)
+def _norm_pos(pos: Optional[str]) -> Optional[PosKey]:
     if not pos:
         return pos
     up = str(pos).upper()
-    return "D/ST" if up in ("DST", "D/ST") else up
+    return _STR_TO_POS.get(up) or sys.intern(up)
 
 
-def _lineup_for_team(league: League, team_id: int, week: Optional[int]) -> Tuple[List, List]:
-    bs_list = league.box_scores(week) if week else league.box_scores()
-    bs = next((b for b in bs_list if b.home_team.team_id == team_id or b.away_team.team_id == team_id), None)
-    if not bs:
-        return [], []
-    lineup = bs.home_lineup if bs.home_team.team_id == team_id else bs.away_lineup
-    starters = [p for p in (lineup or []) if (getattr(p, "slot_position", "") not in ("BE", "IR"))]
-    bench = [p for p in (lineup or []) if (getattr(p, "slot_position", "") in ("BE", "IR"))]
-    return starters, bench
+@lru_cache(maxsize=256)
+def _elig_set(elig: Tuple[Any, ...]) -> FrozenSet[PosKey]:
+    """Eligible slots as normalized positions, comparable with :func:`_norm_pos` output."""
+    return frozenset(_norm_pos(str(s)) for s in elig)
+
+
+_BENCH_SLOTS = frozenset({"BE", "IR"})
+
+
+def _build_lineup_index(bs_list: List[Any]) -> Dict[int, Tuple[List, List, Any]]:
+    """Map ``team_id`` to ``(starters, bench, box_score)`` in one walk of ``bs_list``."""
+    index: Dict[int, Tuple[List, List, Any]] = {}
+    for bs in bs_list:
+        for team, lineup in ((bs.home_team, bs.home_lineup), (bs.away_team, bs.away_lineup)):
+            team_id = getattr(team, "team_id", None)
+            if team_id is None:  # bye weeks leave one side of the box score empty
+                continue
+            starters: List[Any] = []
+            bench: List[Any] = []
+            for p in (lineup or ()):
+                (bench if getattr(p, "slot_position", "") in _BENCH_SLOTS else starters).append(p)
+            # Keep the first box score seen for a team, as the old linear scan did.
+            index.setdefault(team_id, (starters, bench, bs))
+    return index
+
+
+_LINEUP_INDEX_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 
-def _threshold_for(pos: Optional[str], cfg: Config) -> float:
-    posn = _norm_pos(pos) or ""
-    return float(cfg.per_pos_thresholds.get(posn, cfg.start_sit_threshold))
+def _get_lineup_index(league: League, week: Optional[int]) -> Dict[int, Tuple[List, List, Any]]:
+    week = week or getattr(league, "current_week", None)
+    per_league = _LINEUP_INDEX_CACHE.setdefault(league, {})
+    if week not in per_league:
+        per_league[week] = _build_lineup_index(_get_box_scores(league, week))
+    return per_league[week]
+
+
+def _lineup_for_team(league: League, team_id: int, week: Optional[int]) -> Tuple[List, List]:
+    entry = _get_lineup_index(league, week).get(team_id)
+    if not entry:
+        return [], []
+    return entry[0], entry[1]
+
+
+def _best_bench_swap_np(elig: np.ndarray, bench_proj: np.ndarray) -> np.ndarray:
+    """Index of the highest-projected eligible bench player for each starter row, or -1."""
+    if not elig.shape[1]:
+        return np.full(elig.shape[0], -1, dtype=np.int64)
+    best = np.where(elig, bench_proj, -np.inf).argmax(axis=1)
+    best[~elig.any(axis=1)] = -1
+    return best
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _best_bench_swap(elig, bench_proj):
+        n_starters, n_bench = elig.shape
+        best = np.full(n_starters, -1, dtype=np.int64)
+        for i in range(n_starters):
+            top = -np.inf
+            for j in range(n_bench):
+                if elig[i, j] and (best[i] < 0 or bench_proj[j] > top):
+                    best[i] = j
+                    top = bench_proj[j]
+        return best
+else:
+    _best_bench_swap = _best_bench_swap_np
 
 
 def recommend_start_sit(league: League, cfg: Config) -> List[Dict[str, Any]]:
@@ -396,38 +727,49 @@ def recommend_start_sit(league: League, cfg: Config) -> List[Dict[str, Any]]:
     starters, bench = _lineup_for_team(league, cfg.my_team_id, cfg.scoring_period)
     advice: List[Dict[str, Any]] = []
 
-    lockset = {_norm_pos(p) for p in (cfg.lock_positions or [])}
+    lockset = cfg.lockset
+    thresh_map = cfg.per_pos_thresholds
+    default_thresh = float(cfg.start_sit_threshold)
+
+    # Normalized position, eligible slots and projection for every unlocked
+    # bench player, computed once rather than once per starter.
+    bench_players: List[Any] = []
+    bench_pos: List[Optional[PosKey]] = []
+    bench_elig: List[FrozenSet[PosKey]] = []
+    for b in bench:
+        bpos = _norm_pos(getattr(b, "position", None))
+        if bpos in lockset:
+            continue
+        try:
+            eligible_slots = _elig_set(tuple(getattr(b, "eligibleSlots", ()) or ()))
+        except Exception:
+            eligible_slots = frozenset()
+        bench_players.append(b)
+        bench_pos.append(bpos)
+        bench_elig.append(eligible_slots)
+    bench_proj_arr = np.fromiter(map(_proj, bench_players), dtype=np.float64, count=len(bench_players))
 
+    active = []
     for starter in starters:
         starter_pos = _norm_pos(getattr(starter, "position", None))
-        if starter_pos in lockset:
+        if starter_pos not in lockset:
+            active.append((starter, starter_pos))
+
+    # One row per unlocked starter, one column per bench player.  Treat matching
+    # position as eligible; some installs encode by names, others by slot codes.
+    elig = np.zeros((len(active), len(bench_players)), dtype=bool)
+    for i, (_, starter_pos) in enumerate(active):
+        elig[i] = [starter_pos in slots or bpos == starter_pos for bpos, slots in zip(bench_pos, bench_elig)]
+    best_idx = _best_bench_swap(elig, bench_proj_arr)
+
+    for (starter, starter_pos), idx in zip(active, best_idx.tolist()):
+        if idx < 0:
             continue
 
-        start_proj = float(getattr(starter, "projected_points", 0) or 0)
+        best_bench = bench_players[idx]
+        delta = round(float(bench_proj_arr[idx]) - _proj(starter), 2)
 
-        eligible_bench = []
-        for b in bench:
-            bpos = _norm_pos(getattr(b, "position", None))
-            if bpos in lockset:
-                continue
-            eligible = False
-            try:
-                eligible_slots = set(str(s) for s in (getattr(b, "eligibleSlots", []) or []))
-                # Treat matching position as eligible; some installs encode by names, others by slot codes
-                eligible = (starter_pos in eligible_slots) or (bpos == starter_pos)
-            except Exception:
-                eligible = (bpos == starter_pos)
-            if eligible:
-                eligible_bench.append(b)
-
-        if not eligible_bench:
-            continue
-
-        best_bench = max(eligible_bench, key=lambda p: float(getattr(p, "projected_points", 0) or 0))
-        bench_proj = float(getattr(best_bench, "projected_points", 0) or 0)
-        delta = round(bench_proj - start_proj, 2)
-
-        thresh = _threshold_for(starter_pos, cfg)
+        thresh = thresh_map.get(starter_pos, default_thresh)
         if delta >= thresh:
             advice.append({
                 "type": "start_sit",
@@ -441,73 +783,92 @@ def recommend_start_sit(league: League, cfg: Config) -> List[Dict[str, Any]]:
     return advice
 
 
-def _team_strength_by_pos(league: League, team_id: int, week: Optional[int]) -> Dict[str, float]:
-    starters, _ = _lineup_for_team(league, team_id, week)
-    strength: Dict[str, float] = {}
-    for p in starters:
-        pos = _norm_pos(getattr(p, "position", None))
-        strength[pos] = strength.get(pos, 0.0) + float(getattr(p, "projected_points", 0) or 0)
+def _strength_by_team(lineups: Dict[int, Tuple[List, List]]) -> Dict[int, Dict[Optional[PosKey], float]]:
+    """Projected starter points per normalized position for every team in ``lineups``.
+
+    Teams without starters map to an empty dict.
+    """
+    strength: Dict[int, Dict[Optional[PosKey], float]] = {}
+    for team_id, (starters, _) in lineups.items():
+        team_strength: DefaultDict[Optional[PosKey], float] = defaultdict(float)
+        for p in starters:
+            team_strength[_norm_pos(getattr(p, "position", None))] += _proj(p)
+        # Plain dict, so callers' .get(pos, 0.0) lookups don't insert keys.
+        strength[team_id] = dict(team_strength)
     return strength
 
 
+def _first_by_pos(players: List[Any]) -> Dict[Optional[PosKey], Any]:
+    """Map each normalized position to the first player listed at it."""
+    first: Dict[Optional[PosKey], Any] = {}
+    for p in players:
+        first.setdefault(_norm_pos(getattr(p, "position", None)), p)
+    return first
+
+
 def recommend_trades(league: League, cfg: Config) -> List[Dict[str, Any]]:
     if cfg.my_team_id is None:
         return []
 
-    my_strength = _team_strength_by_pos(league, cfg.my_team_id, cfg.scoring_period)
-    my_starters, my_bench = _lineup_for_team(league, cfg.my_team_id, cfg.scoring_period)
+    week = cfg.scoring_period
+    my_team_id = cfg.my_team_id
+    my_starters, my_bench = _lineup_for_team(league, my_team_id, week)
 
-    lockset = {_norm_pos(p) for p in (cfg.lock_positions or [])}
+    lockset = cfg.lockset
     bench_assets = [p for p in my_bench if _norm_pos(getattr(p, "position", None)) not in lockset]
+    send_by_pos = _first_by_pos(bench_assets)
+
+    # Every opponent's lineup, strength and bench index, computed once up front.
+    opponents = [t for t in league.teams if t.team_id != my_team_id]
+    all_lineups = {t.team_id: _lineup_for_team(league, t.team_id, week) for t in opponents}
+    all_strength = _strength_by_team({my_team_id: (my_starters, my_bench), **all_lineups})
+    my_strength = all_strength[my_team_id]
+    all_recv = {tid: _first_by_pos(bench) for tid, (_, bench) in all_lineups.items()}
 
     recs: List[Dict[str, Any]] = []
     need_margin = 8.0  # simple threshold for positional imbalance
 
-    for opp in league.teams:
-        if opp.team_id == cfg.my_team_id:
-            continue
-        opp_strength = _team_strength_by_pos(league, opp.team_id, cfg.scoring_period)
+    for opp in opponents:
+        opp_strength = all_strength[opp.team_id]
+        recv_by_pos = all_recv[opp.team_id]
 
-        for give_pos in ["RB", "WR", "QB", "TE"]:
-            gp = _norm_pos(give_pos)
+        for gp in _TRADE_POSITIONS:
             if gp in lockset:
                 continue
             if my_strength.get(gp, 0.0) > opp_strength.get(gp, 0.0) + need_margin:
-                for need_pos in ["RB", "WR", "QB", "TE"]:
-                    np = _norm_pos(need_pos)
-                    if np == gp or np in lockset:
+                for want_pos in _TRADE_POSITIONS:
+                    if want_pos == gp or want_pos in lockset:
                         continue
-                    if opp_strength.get(np, 0.0) > my_strength.get(np, 0.0) + need_margin:
-                        opp_starters, opp_bench = _lineup_for_team(league, opp.team_id, cfg.scoring_period)
-                        send = next((p for p in bench_assets if _norm_pos(getattr(p, "position", None)) == gp), None)
-                        recv = next((p for p in opp_bench if _norm_pos(getattr(p, "position", None)) == np), None)
+                    if opp_strength.get(want_pos, 0.0) > my_strength.get(want_pos, 0.0) + need_margin:
+                        send = send_by_pos.get(gp)
+                        recv = recv_by_pos.get(want_pos)
                         if send and recv:
                             recs.append({
                                 "type": "trade",
                                 "trade_with_team": opp.team_name,
                                 "send_player": f"{send.name} ({getattr(send, 'position', None)})",
                                 "receive_player": f"{recv.name} ({getattr(recv, 'position', None)})",
-                                "rationale": f"Surplus at {gp} for us vs. {opp.team_name}; they’re deeper at {np}.",
+                                "rationale": f"Surplus at {gp} for us vs. {opp.team_name}; they’re deeper at {want_pos}.",
                             })
+                            # At most one offer per (opponent, give position): ``send`` is
+                            # fixed for ``gp``, so take the first position in
+                            # _TRADE_POSITIONS order the opponent is deeper at and move
+                            # on to the next give position.
+                            break
     return recs[:5]
 
 
 def free_agent_targets(league: League, cfg: Config) -> List[Dict[str, Any]]:
-    lockset = {_norm_pos(p) for p in (cfg.lock_positions or [])}
+    lockset = cfg.lockset
     recs: List[Dict[str, Any]] = []
-    for pos in ["RB", "WR", "TE", "QB", "D/ST", "K"]:
-        if _norm_pos(pos) in lockset:
-            continue
-        try:
-            fas = league.free_agents(size=cfg.free_agent_pool_size, position=pos)
-        except Exception:
-            continue
-        best = sorted(fas, key=lambda p: float(getattr(p, "projected_points", 0) or 0), reverse=True)[:5]
+    positions = [pos for pos in ["RB", "WR", "TE", "QB", "D/ST", "K"] if _norm_pos(pos) not in lockset]
+    for pos, fas in _fetch_free_agents(league, cfg.free_agent_pool_size, positions):
+        best = heapq.nlargest(5, fas, key=_proj)
         for p in best:
             recs.append({
                 "type": "add",
                 "player": f"{p.name} ({getattr(p, 'position', None)})",
-                "proj_points": round(float(getattr(p, "projected_points", 0) or 0), 2),
+                "proj_points": round(_proj(p), 2),
                 "why": f"Top available {pos} by projections; {getattr(p, 'percent_owned', None)}% rostered.",
             })
     return recs[:10]
@@ -518,29 +879,26 @@ def write_advice_markdown(out_dir: str, week: Optional[int], advice_items: List[
     if not advice_items:
         content = f"# Daily Pre-Game Analysis\n\n**League scoring:** {league_scoring}\n\n_No actionable recommendations today._\n"
     else:
-        lines = [f"# Daily Pre-Game Analysis", f"**League scoring:** {league_scoring}", ""]
-        start_sit = [a for a in advice_items if a["type"] == "start_sit"]
-        trades = [a for a in advice_items if a["type"] == "trade"]
-        adds = [a for a in advice_items if a["type"] == "add"]
-        if start_sit:
-            lines.append("## Start/Sit")
-            for a in start_sit:
-                lines.append(
-                    f"- **Start {a['bench_in']} ({a['bench_pos']}) over {a['starter_out']} ({a['starter_pos']})** "
-                    f"— +{a['proj_delta']} proj pts (threshold {a['threshold_used']})."
-                )
-            lines.append("")
-        if adds:
-            lines.append("## Free-Agent Targets")
-            for a in adds:
-                lines.append(f"- **{a['player']}** — {a['proj_points']} proj pts. {a['why']}")
-            lines.append("")
-        if trades:
-            lines.append("## Trade Ideas")
-            for a in trades:
-                lines.append(f"- With **{a['trade_with_team']}**: Send **{a['send_player']}**, receive **{a['receive_player']}** — {a['rationale']}")
-            lines.append("")
-        content = "\n".join(lines)
+        start_sit = [
+            f"- **Start {a['bench_in']} ({a['bench_pos']}) over {a['starter_out']} ({a['starter_pos']})** "
+            f"— +{a['proj_delta']} proj pts (threshold {a['threshold_used']})."
+            for a in advice_items if a["type"] == "start_sit"
+        ]
+        adds = [
+            f"- **{a['player']}** — {a['proj_points']} proj pts. {a['why']}"
+            for a in advice_items if a["type"] == "add"
+        ]
+        trades = [
+            f"- With **{a['trade_with_team']}**: Send **{a['send_player']}**, receive **{a['receive_player']}** — {a['rationale']}"
+            for a in advice_items if a["type"] == "trade"
+        ]
+        sections = [
+            f"# Daily Pre-Game Analysis\n**League scoring:** {league_scoring}",
+            "## Start/Sit\n" + "\n".join(start_sit) if start_sit else "",
+            "## Free-Agent Targets\n" + "\n".join(adds) if adds else "",
+            "## Trade Ideas\n" + "\n".join(trades) if trades else "",
+        ]
+        content = "\n\n".join(filter(None, sections)) + "\n"
 
     fname = f"analysis_week_{week or 'current'}_{today_et_date_str()}.md"
     with open(os.path.join(out_dir, fname), "w", encoding="utf-8") as f:
@@ -551,11 +909,32 @@ def write_advice_markdown(out_dir: str, week: Optional[int], advice_items: List[
 # Workbook writer
 # --------------------------
 
+def _write_str_cell(ws: Any, row: int, col: int, token: Any, cell_format: Any = None) -> int:
+    return ws.write_string(row, col, str(token), cell_format)
+
+
 def write_workbook(xlsx_path: str, dfs: Dict[str, pd.DataFrame]) -> None:
-    with pd.ExcelWriter(xlsx_path, engine="xlsxwriter") as writer:
+    """Write each frame to its own sheet, streaming rows straight to xlsxwriter.
+
+    ``DataFrame.to_excel`` formats every cell through pandas' Excel formatter;
+    writing plain rows in ``constant_memory`` mode is faster and flushes each
+    row to disk as it goes.  Missing values are left as empty cells, and
+    containers (e.g. the dicts and lists in ``league_settings``) are written as
+    ``str(value)``, as pandas did.
+    """
+    workbook = xlsxwriter.Workbook(xlsx_path, {"constant_memory": True, "strings_to_numbers": False})
+    try:
         for name, df in dfs.items():
-            sheet = name[:31]
-            df.to_excel(writer, sheet_name=sheet, index=False)
+            ws = workbook.add_worksheet(name[:31])
+            for container in (dict, list, tuple, set):
+                ws.add_write_handler(container, _write_str_cell)
+            ws.write_row(0, 0, [str(c) for c in df.columns])
+            # Swap NaN for None once per sheet so the row loop writes values as-is.
+            cells = df.astype(object).where(df.notna(), None)
+            for r, row in enumerate(cells.itertuples(index=False, name=None), start=1):
+                ws.write_row(r, 0, row)
+    finally:
+        workbook.close()
 
 
 # --------------------------
@@ -581,14 +960,27 @@ def main() -> None:
     # that downstream exports always receive a concrete value.
     week = cfg.scoring_period or getattr(league, "current_week", None)
 
-    # Exports
-    df_standings = export_standings(league, cfg.out_dir)
-    df_matchups = export_matchups(league, cfg.out_dir, week)
-    df_rosters = export_rosters(league, cfg.out_dir, week)
-    df_current_rosters = export_current_team_rosters(league, cfg.out_dir)
-    df_free = export_free_agents(league, cfg.out_dir, cfg.free_agent_pool_size, cfg.positions)
-    df_pro = export_upcoming_pro_schedule(league, cfg.out_dir)
-    df_settings = export_league_settings(league, cfg.out_dir)
+    # Exports.  Each one is dominated by ESPN round-trips, so run them on a
+    # thread pool.  Box scores are shared, so fetch them here first; the
+    # workers then only read the cached lists.
+    _get_lineup_index(league, week)
+    _get_lineup_index(league, None)
+    fmt = cfg.export_format
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        # Keyed by workbook sheet name, in sheet order.
+        futures = {
+            "standings": pool.submit(export_standings, league, cfg.out_dir, fmt),
+            "matchups": pool.submit(export_matchups, league, cfg.out_dir, week, fmt),
+            "rosters": pool.submit(export_rosters, league, cfg.out_dir, week, fmt),
+            "free_agents": pool.submit(
+                export_free_agents, league, cfg.out_dir, cfg.free_agent_pool_size, cfg.positions, fmt
+            ),
+            "current_rosters": pool.submit(export_current_team_rosters, league, cfg.out_dir, fmt),
+            "pro_schedule": pool.submit(export_upcoming_pro_schedule, league, cfg.out_dir, fmt),
+            # league_settings.txt stays CSV so it remains readable and feeds the AI prompt.
+            "league_settings": pool.submit(export_league_settings, league, cfg.out_dir),
+        }
+        dfs = {name: future.result() for name, future in futures.items()}
 
     if args.write_analysis:
         advice_items: List[Dict[str, Any]] = []
@@ -598,18 +990,7 @@ def main() -> None:
         write_advice_markdown(cfg.out_dir, week, advice_items, cfg, league)
 
     if args.write_xlsx:
-        write_workbook(
-            cfg.xlsx_path,
-            {
-                "standings": df_standings,
-                "matchups": df_matchups,
-                "rosters": df_rosters,
-                "free_agents": df_free,
-                "current_rosters": df_current_rosters,
-                "pro_schedule": df_pro,
-                "league_settings": df_settings,
-            },
-        )
+        write_workbook(cfg.xlsx_path, dfs)
 
     print("Done.")
 
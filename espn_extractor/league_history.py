@@ -3,8 +3,12 @@
 League history extraction.
 
 Production mode:
-    - Pulls team history from ESPN via `espn_api`, one season at a time.
-    - If a given season fails (403/404/rate-limit), it logs and skips that season.
+    - Pulls team history from ESPN via `espn_api`, several seasons at a time.
+    - Extracted rows are cached on disk per (league_id, year); a cache written
+      after the season's playoffs never expires, anything else is refetched
+      after a few minutes.
+    - If a given season fails (403/404/rate-limit), it logs a warning and skips
+      that season.
     - It still writes the output file (at least the header), so prod runs
       don't silently produce nothing.
 
@@ -19,16 +23,22 @@ Public API:
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
+import json
+import logging
 import os
-import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Iterable, Dict, Any, List, Optional
+from datetime import datetime
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Callable, Iterator, Iterable, Dict, Any, List, Optional, Sequence, Tuple
 
-try:
-    # espn_api is only required for production pulls
-    from espn_api.football import League as FF_LEAGUE  # type: ignore
-except ImportError:  # pragma: no cover - not needed for tests
-    FF_LEAGUE = None  # type: ignore[assignment]
+_log = logging.getLogger(__name__)
 
 
 # ----------------------------
@@ -209,7 +219,7 @@ _SAMPLE_HISTORY_2018: Iterable[Dict[str, Any]] = [
     },
 ]
 
-_HEADERS: List[str] = [
+_HEADERS: Tuple[str, ...] = (
     "owner",
     "year",
     "team_name",
@@ -225,7 +235,12 @@ _HEADERS: List[str] = [
     "streak_length",
     "streak_type",
     "playoff_seed",
-]
+)
+
+# The fixture as rows in ``_HEADERS`` order, ready for ``csv.writer``.
+_SAMPLE_ROWS_2018: Tuple[Tuple[Any, ...], ...] = tuple(
+    tuple(row[h] for h in _HEADERS) for row in _SAMPLE_HISTORY_2018
+)
 
 
 @dataclass
@@ -238,40 +253,178 @@ class _ConfigLike:
     espn_s2: Optional[str] = None
     swid: Optional[str] = None
     debug: bool = False
+    # Write outputs over 1000 rows with pyarrow's CSV writer when it is
+    # installed.  The result parses to the same rows but is not byte-identical
+    # to the csv module's: pyarrow quotes every string value and header name,
+    # ends lines with "\n" rather than "\r\n", and drops a whole float's ".0"
+    # (1000.0 is written as 1000).  Smaller outputs always use csv.
+    use_arrow: bool = False
+
+
+# csv.writer issues one write() per row; a 1 MiB buffer turns a long history
+# into a handful of syscalls instead of one per ~8 KiB.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Rows are handed to writerows() in batches of this size, reusing one list.
+_WRITE_CHUNK_ROWS = 1000
+
+
+@contextmanager
+def _open_atomic(path: str, mode: str = "w", buffering: int = -1) -> Iterator[Any]:
+    """Open a temp file next to ``path`` for writing; publish it with os.replace.
+
+    Readers (or a concurrent test run) never see a half-written file.  On error
+    the temp file is removed and ``path`` is left untouched.  ``mode`` is "w"
+    (UTF-8 text, no newline translation) or "wb".
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if "b" in mode:
+        kwargs: Dict[str, Any] = {}
+    else:
+        kwargs = {"newline": "", "encoding": "utf-8"}
+    try:
+        with open(tmp, mode, buffering=buffering, **kwargs) as fh:
+            yield fh
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+# Below this many rows pyarrow's import cost outweighs its faster CSV writer.
+_ARROW_MIN_ROWS = 1000
+
 
+def _write_columns_arrow(path: str, delimiter: str, columns: Dict[str, List[Any]]) -> bool:
+    """Write ``columns`` with pyarrow's C++ CSV writer.
 
-def _write_rows(path: str, delimiter: str, rows: Iterable[Dict[str, Any]]) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as out_file_handle:
-        writer = csv.DictWriter(out_file_handle, fieldnames=_HEADERS, delimiter=delimiter)
-        writer.writeheader()
+    Returns False (having written nothing) when pyarrow is not installed or
+    cannot infer a column type, so the caller can fall back to stdlib csv.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return False
+    try:
+        table = pa.table(columns)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return False
+    options = pa_csv.WriteOptions(delimiter=delimiter)
+    with _open_atomic(path, "wb", buffering=_WRITE_BUFFER_SIZE) as out_file_handle:
+        pa_csv.write_csv(table, out_file_handle, write_options=options)
+    return True
+
+
+def _write_columns(
+    path: str, delimiter: str, columns: Dict[str, List[Any]], use_arrow: bool = False
+) -> int:
+    """Write column lists keyed by ``_HEADERS``; returns the number of rows.
+
+    With ``use_arrow``, outputs over ``_ARROW_MIN_ROWS`` rows are written by
+    pyarrow when it is available; see ``_ConfigLike.use_arrow`` for how its
+    format differs.  Otherwise rows are zipped back together for
+    :func:`_write_rows`.
+    """
+    n_rows = len(columns[_HEADERS[0]])
+    if use_arrow and n_rows > _ARROW_MIN_ROWS and _write_columns_arrow(path, delimiter, columns):
+        return n_rows
+    return _write_rows(path, delimiter, zip(*(columns[h] for h in _HEADERS)))
+
+
+def _write_rows(path: str, delimiter: str, rows: Iterable[Sequence[Any]]) -> int:
+    """Write the header and ``rows`` (sequences in ``_HEADERS`` order).
+
+    ``rows`` may be a generator; it is consumed lazily, so memory stays flat.
+    Returns the number of data rows written.
+    """
+    count = 0
+    chunk: List[Sequence[Any]] = []
+    with _open_atomic(path, buffering=_WRITE_BUFFER_SIZE) as out_file_handle:
+        writer = csv.writer(out_file_handle, delimiter=delimiter)
+        writer.writerow(_HEADERS)
         for row in rows:
-            writer.writerow(row)
+            chunk.append(row)
+            if len(chunk) >= _WRITE_CHUNK_ROWS:
+                writer.writerows(chunk)
+                count += len(chunk)
+                chunk.clear()
+        writer.writerows(chunk)
+        count += len(chunk)
+    return count
+
+
+def _encode_rows(delimiter: str, rows: Iterable[Sequence[Any]]) -> str:
+    """``rows`` rendered exactly as :func:`_write_rows` would write them."""
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf, delimiter=delimiter)
+    writer.writerow(_HEADERS)
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
+# The fixture never changes, so encode it once for the delimiters tests use.
+_SAMPLE_CSV_COMMA = _encode_rows(",", _SAMPLE_ROWS_2018)
+_SAMPLE_CSV_PIPE = _encode_rows("|", _SAMPLE_ROWS_2018)
+
+# Size and SHA-256 of each encoded fixture, to detect an up-to-date file.
+_FIXTURE_DIGESTS: Dict[str, Tuple[int, bytes]] = {
+    delim: (len(data), hashlib.sha256(data).digest())
+    for delim, data in ((",", _SAMPLE_CSV_COMMA.encode("utf-8")), ("|", _SAMPLE_CSV_PIPE.encode("utf-8")))
+}
+
+
+def _file_matches(path: str, size: int, digest: bytes) -> bool:
+    try:
+        if os.stat(path).st_size != size:
+            return False
+        sha = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(1 << 16), b""):
+                sha.update(block)
+    except OSError:
+        return False
+    return sha.digest() == digest
 
 
 def _write_offline_fixture(config: _ConfigLike) -> None:
-    _write_rows(config.out_file, config.delimiter, _SAMPLE_HISTORY_2018)
+    if config.delimiter == ",":
+        blob = _SAMPLE_CSV_COMMA
+    elif config.delimiter == "|":
+        blob = _SAMPLE_CSV_PIPE
+    else:
+        _write_rows(config.out_file, config.delimiter, _SAMPLE_ROWS_2018)
+        return
+    # Repeated test runs usually find the identical file already in place.
+    if _file_matches(config.out_file, *_FIXTURE_DIGESTS[config.delimiter]):
+        return
+    with _open_atomic(config.out_file) as out_file_handle:
+        out_file_handle.write(blob)
 
 
 def _safe_str(value: Any) -> str:
     """Convert owner/owners value into a readable string."""
+    if type(value) is str:  # the usual case
+        return value
     if value is None:
         return ""
     if isinstance(value, (list, tuple, set)):
-        return ", ".join(str(x) for x in value)
+        return ", ".join(map(str, value))
     return str(value)
 
 
-def _resolve_owner(team: Any) -> str:
+# Ownership attributes across espn_api versions, in order of preference.
+_OWNER_ATTRS: Tuple[str, ...] = ("owner", "owners", "primary_owner", "primaryOwner")
+
+
+def _resolve_owner(team: Any, attrs: Tuple[str, ...] = _OWNER_ATTRS) -> str:
     """
-    Different espn_api versions expose ownership differently. Try a few.
+    Different espn_api versions expose ownership differently. Try a few,
+    stopping at the first truthy one.  ``attrs`` can be narrowed to the
+    names a league's team class actually has.
     """
-    candidates: List[Optional[Any]] = [
-        getattr(team, "owner", None),
-        getattr(team, "owners", None),
-        getattr(team, "primary_owner", None),
-        getattr(team, "primaryOwner", None),
-    ]
-    for cand in candidates:
+    for name in attrs:
+        cand = getattr(team, name, None)
         if cand:
             return _safe_str(cand)
     return ""
@@ -285,58 +438,226 @@ def _resolve_team_name(team: Any) -> str:
     )
 
 
-def _iter_production_rows(config: _ConfigLike) -> Iterable[Dict[str, Any]]:  # pragma: no cover
+# ----------------------------
+# Season row cache
+# ----------------------------
+
+# Default cache location; ESPN_EXTRACTOR_CACHE_DIR overrides it and an empty
+# value disables the cache.
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "espn_extractor")
+
+# A cache file for a season that was still in progress when written is only
+# trusted for a few minutes.
+_CURRENT_SEASON_TTL = 300.0
+
+# Fantasy playoffs for season ``year`` run into January of ``year + 1``.  Data
+# written on or after this (month, day) of the following year is final.
+_SEASON_FINAL_MONTH_DAY = (2, 1)
+
+
+def _cache_path(league_id: int, year: int) -> Optional[str]:
+    """Cache file for a season, or ``None`` when caching is disabled."""
+    cache_dir = os.environ.get("ESPN_EXTRACTOR_CACHE_DIR", _CACHE_DIR)
+    if not cache_dir:
+        return None
+    return os.path.join(cache_dir, str(league_id), f"{year}.json")
+
+
+def _season_final_after(year: int) -> float:
+    """Timestamp after which season ``year`` can no longer change."""
+    month, day = _SEASON_FINAL_MONTH_DAY
+    return datetime(year + 1, month, day).timestamp()
+
+
+def _cache_is_fresh(year: int, mtime: float) -> bool:
+    """A cache file is good forever if it was written after the season was
+    final, otherwise only for ``_CURRENT_SEASON_TTL`` seconds.  This is based
+    on when the file was written, so a mid-season snapshot is never promoted
+    to final just because the calendar moved on."""
+    if mtime >= _season_final_after(year):
+        return True
+    return time.time() - mtime <= _CURRENT_SEASON_TTL
+
+
+@lru_cache(maxsize=64)
+def _load_cached_rows(path: str, mtime_ns: int) -> Tuple[Tuple[Any, ...], ...]:
+    """Rows from a cache file; ``ValueError`` if it was written for other headers."""
+    with open(path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    if not isinstance(data, dict) or tuple(data.get("headers", ())) != _HEADERS:
+        raise ValueError(f"{path}: cached for different headers")
+    rows = tuple(tuple(row) for row in data["rows"])
+    if any(len(row) != len(_HEADERS) for row in rows):
+        raise ValueError(f"{path}: row length does not match headers")
+    return rows
+
+
+def _read_season_cache(league_id: int, year: int) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+    """Cached rows for a season, or ``None`` if missing, stale or unreadable."""
+    path = _cache_path(league_id, year)
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+        if not _cache_is_fresh(year, st.st_mtime):
+            return None
+        return _load_cached_rows(path, st.st_mtime_ns)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_season_cache(league_id: int, year: int, rows: Sequence[Sequence[Any]]) -> None:
+    """Persist a season's rows, stamped with ``_HEADERS`` so a later change to
+    the columns invalidates them.  Cache problems are never fatal."""
+    path = _cache_path(league_id, year)
+    if path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with _open_atomic(path) as fh:
+            json.dump({"headers": _HEADERS, "rows": rows}, fh, default=str)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+# ----------------------------
+# Production (espn_api) rows
+# ----------------------------
+
+# Seasons are fetched concurrently; keep the fan-out modest so a long history
+# doesn't trip ESPN's rate limiting.
+_MAX_FETCH_WORKERS = 8
+
+
+# Team stat columns after owner/year/team_name, in ``_HEADERS`` order: the
+# attribute names different espn_api versions use, and the default when a
+# version has none of them.
+_TEAM_FIELDS: Tuple[Tuple[Tuple[str, ...], Any], ...] = (
+    (("wins",), 0),
+    (("losses",), 0),
+    (("ties",), 0),
+    (("final_standing", "finalStanding"), 0),
+    (("points_for",), 0.0),
+    (("points_against",), 0.0),
+    (("acquisitions",), 0),
+    (("trades",), 0),
+    (("drops",), 0),
+    (("streak_length",), 0),
+    (("streak_type", "streakType"), ""),
+    (("playoff_seed", "playoffSeed"), 0),
+)
+
+
+def _field_getter(sample: Any, names: Tuple[str, ...], default: Any) -> Callable[[Any], Any]:
+    for name in names:
+        if hasattr(sample, name):
+            return attrgetter(name)
+    return lambda _team: default
+
+
+def _team_rows(league: Any, year: int) -> List[Tuple[Any, ...]]:
+    """One row per team in a fetched league, as tuples in ``_HEADERS`` order.
+
+    All teams in a league share one class, so which attribute spelling this
+    espn_api version uses is probed once on the first team.
     """
-    Generator that pulls from espn_api in production mode.
-    Skips seasons that error while still yielding other years.
+    teams = list(getattr(league, "teams", []) or [])
+    if not teams:
+        return []
+    sample = teams[0]
+    getters = [_field_getter(sample, names, default) for names, default in _TEAM_FIELDS]
+    owner_attrs = tuple(name for name in _OWNER_ATTRS if hasattr(sample, name))
+    resolve_owner, resolve_team_name = _resolve_owner, _resolve_team_name
+    return [
+        (resolve_owner(team, owner_attrs), year, resolve_team_name(team), *[get(team) for get in getters])
+        for team in teams
+    ]
+
+
+def _fetch_season(
+    year: int,
+    league_cls: Any,
+    league_id: int,
+    espn_s2: Optional[str],
+    swid: Optional[str],
+    debug: bool,
+) -> Tuple[int, Sequence[Tuple[Any, ...]], Optional[Exception]]:
+    """Rows for one season; returns ``(year, rows, None)`` or ``(year, (), exc)``.
+
+    Served from the disk cache when fresh; otherwise fetched from ESPN and
+    written back to the cache.
+    """
+    cached = _read_season_cache(league_id, year)
+    if cached is not None:
+        return year, cached, None
+    try:
+        league = league_cls(
+            league_id=league_id,
+            year=year,
+            espn_s2=espn_s2,
+            swid=swid,
+            fetch_league=False,
+            debug=debug,
+        )
+        league.fetch_league()  # explicit fetch so we can control failures
+    except Exception as exc:
+        return year, (), exc
+    rows = _team_rows(league, year)
+    if rows:
+        # A season with no teams is more likely an API hiccup than real data;
+        # don't let it stick.
+        _write_season_cache(league_id, year, rows)
+    return year, rows, None
+
+
+def _iter_production_rows(config: _ConfigLike) -> Iterable[Tuple[Any, ...]]:  # pragma: no cover
     """
-    if FF_LEAGUE is None:
+    Rows pulled from espn_api in production mode, as tuples in ``_HEADERS``
+    order.  Seasons are fetched in parallel and yielded in year order as soon
+    as each is ready.  Skips seasons that error while still yielding other years.
+    """
+    # espn_api (and requests under it) is only needed here, so test-mode
+    # imports of this module don't pay for it.
+    try:
+        from espn_api.football import League as FF_LEAGUE  # type: ignore
+    except ImportError:
         raise RuntimeError(
             "espn_api is not available. Install it or run with test_mode=True."
-        )
+        ) from None
+    return _generate_production_rows(config, FF_LEAGUE)
 
-    for year in range(config.start_year, config.end_year + 1):
-        try:
-            league = FF_LEAGUE(
-                league_id=config.league_id,
-                year=year,
-                espn_s2=config.espn_s2,
-                swid=config.swid,
-                fetch_league=False,
-                debug=config.debug,
-            )
-            league.fetch_league()  # explicit fetch so we can control failures
-        except Exception as exc:
-            print(
-                f"[league_history] Skipping {year}: failed to fetch league ({exc})",
-                file=sys.stderr,
-            )
-            continue
-
-        for team in getattr(league, "teams", []):
-            yield {
-                "owner": _resolve_owner(team),
-                "year": year,
-                "team_name": _resolve_team_name(team),
-                "win": getattr(team, "wins", 0),
-                "loss": getattr(team, "losses", 0),
-                "draws": getattr(team, "ties", 0),
-                "final_standing": getattr(
-                    team, "final_standing", getattr(team, "finalStanding", 0)
-                ),
-                "points_for": getattr(team, "points_for", 0.0),
-                "points_against": getattr(team, "points_against", 0.0),
-                "acquisitions": getattr(team, "acquisitions", 0),
-                "trades": getattr(team, "trades", 0),
-                "drops": getattr(team, "drops", 0),
-                "streak_length": getattr(team, "streak_length", 0),
-                "streak_type": getattr(
-                    team, "streak_type", getattr(team, "streakType", "")
-                ),
-                "playoff_seed": getattr(
-                    team, "playoff_seed", getattr(team, "playoffSeed", 0)
-                ),
-            }
+
+def _generate_production_rows(
+    config: _ConfigLike, league_cls: Any
+) -> Iterable[Tuple[Any, ...]]:  # pragma: no cover
+    years = range(config.start_year, config.end_year + 1)
+    if not years:
+        return
+    # Read the config once here rather than in every worker.
+    fetch = partial(
+        _fetch_season,
+        league_cls=league_cls,
+        league_id=config.league_id,
+        espn_s2=config.espn_s2,
+        swid=config.swid,
+        debug=config.debug,
+    )
+    with ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(years))) as pool:
+        for year, rows, exc in pool.map(fetch, years):
+            if exc is not None:
+                _log.warning("Skipping %s: failed to fetch league (%s)", year, exc)
+                continue
+            yield from rows
+
+
+def _collect_production_columns(config: _ConfigLike) -> Dict[str, List[Any]]:  # pragma: no cover
+    """All production rows as one list per ``_HEADERS`` column, for bulk writers."""
+    columns: Dict[str, List[Any]] = {h: [] for h in _HEADERS}
+    appends = [columns[h].append for h in _HEADERS]
+    for row in _iter_production_rows(config):
+        for append, value in zip(appends, row):
+            append(value)
+    return columns
 
 
 def extract_team_records(config: _ConfigLike, test_mode: bool = False) -> None:
@@ -345,7 +666,8 @@ def extract_team_records(config: _ConfigLike, test_mode: bool = False) -> None:
 
     Args:
         config: object with league_id, start_year, end_year, out_file, delimiter,
-                espn_s2, swid, debug.
+                espn_s2, swid, debug and optionally use_arrow (write large
+                outputs with pyarrow when it is installed).
         test_mode: when True, do NOT access the ESPN API; emit a stable offline fixture.
 
     Behavior:
@@ -355,7 +677,7 @@ def extract_team_records(config: _ConfigLike, test_mode: bool = False) -> None:
     Raises:
         RuntimeError if espn_api is unavailable in production mode.
     """
-    print("Extracting ESPN Data")
+    _log.info("Extracting ESPN Data")
 
     # Older config styles used by tests provide ``output_dir``/``history_file``
     # instead of ``out_file``/``delimiter``.  Normalize here so the rest of the
@@ -368,13 +690,20 @@ def extract_team_records(config: _ConfigLike, test_mode: bool = False) -> None:
         config.delimiter = getattr(config, "format", ",")  # type: ignore[attr-defined]
 
     if test_mode:
-        print(f"Writing offline fixture to {config.out_file}")
+        _log.info("Writing offline fixture to %s", config.out_file)
         _write_offline_fixture(config)
         return
 
-    print(f"Processing Years {config.start_year}-{config.end_year}")
-    rows = list(_iter_production_rows(config))
-
-    # Always write the file, even if rows is empty (header-only).
-    _write_rows(config.out_file, config.delimiter, rows)
-    print(f"Wrote {len(rows)} rows to {config.out_file}")
\ No newline at end of file
+    _log.info("Processing Years %s-%s", config.start_year, config.end_year)
+
+    # Always write the file, even if there are no rows (header-only).
+    if getattr(config, "use_arrow", False):
+        # Bulk writer: gather columns first so pyarrow needs no transpose.
+        columns = _collect_production_columns(config)
+        count = _write_columns(config.out_file, config.delimiter, columns, use_arrow=True)
+    else:
+        # Rows are streamed, so memory stays flat however many seasons there
+        # are; the file itself still appears all at once, when _open_atomic
+        # publishes it (rows sit in the temp file's 1 MiB buffer until then).
+        count = _write_rows(config.out_file, config.delimiter, _iter_production_rows(config))
+    _log.info("Wrote %s rows to %s", count, config.out_file)
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""Minimal stand-ins for the espn_api objects used by the exporters and analysis."""
+
+from datetime import datetime, timedelta
+
+from dateutil import tz
+
+_TZ_ET = tz.gettz("America/New_York")
+
+
+class Player:
+    def __init__(self, player_id: int, name: str, slot: str, position: str = "QB"):
+        self.playerId = player_id
+        self.name = name
+        self.position = position
+        self.slot_position = slot
+        self.proTeam = "TEAM"
+        self.projected_points = 0
+        self.points = 0
+        self.injuryStatus = "ACTIVE"
+        self.percent_owned = 0
+        self.percent_started = 0
+        self.eligibleSlots = [position, "OP", "BE"]
+
+
+class Team:
+    def __init__(self, team_id: int, team_name: str, lineup):
+        self.team_id = team_id
+        self.team_name = team_name
+        # Simulate bug where team.roster misses bench players
+        self.roster = [p for p in lineup if p.slot_position != "BE"]
+
+
+class BoxScore:
+    def __init__(self, home_team, away_team, home_lineup, away_lineup, home_score=0, away_score=0):
+        self.home_team = home_team
+        self.away_team = away_team
+        self.home_lineup = home_lineup
+        self.away_lineup = away_lineup
+        self.home_score = home_score
+        self.away_score = away_score
+
+
+class LeagueStub:
+    def __init__(self):
+        self.current_week = 7
+        self._team_a_lineup = [
+            Player(1, "Starter A1", "QB"),
+            Player(2, "Bench A1", "BE"),
+        ]
+        self._team_b_lineup = [
+            Player(3, "Starter B1", "RB"),
+            Player(4, "Bench B1", "BE"),
+        ]
+        self.teams = [
+            Team(1, "Team A", self._team_a_lineup),
+            Team(2, "Team B", self._team_b_lineup),
+        ]
+        self._box = BoxScore(
+            self.teams[0], self.teams[1], self._team_a_lineup, self._team_b_lineup
+        )
+        self._fa = {
+            "QB": [Player(10, "FA QB", "BE")],
+            "RB": [Player(11, "FA RB", "BE", position="RB")],
+        }
+        self._schedule_cache = None
+
+    def box_scores(self, week=None):
+        return [self._box]
+
+    def free_agents(self, size: int, position: str):
+        return self._fa.get(position, [])
+
+    def _get_all_pro_schedule(self):
+        # Built once per stub; the module-scoped fixture shares it across tests.
+        if self._schedule_cache is None:
+            self._schedule_cache = self._build_pro_schedule()
+        return self._schedule_cache
+
+    def _build_pro_schedule(self):
+        now = datetime.now(_TZ_ET)
+        past = int((now - timedelta(days=1)).timestamp() * 1000)
+        future = int((now + timedelta(days=1)).timestamp() * 1000)
+        return {
+            1: {
+                "1": [
+                    {"gameId": 1, "date": past, "homeProTeamId": 1, "awayProTeamId": 2},
+                    {"gameId": 2, "date": future, "homeProTeamId": 3, "awayProTeamId": 4},
+                ]
+            },
+            2: {"1": [{"gameId": 2, "date": future, "homeProTeamId": 3, "awayProTeamId": 4}]},
+        }
@@ -0,0 +1,14 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from _stubs import LeagueStub
+
+
+# The stub is read-only in the tests that use it, so build it once per module.
+@pytest.fixture(scope="module")
+def league():
+    return LeagueStub()
@@ -1,99 +1,32 @@
+import html
 import sys
+import zipfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from datetime import datetime, timedelta
-from dateutil import tz
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import numpy as np
+import pytest
+
+from _stubs import BoxScore, LeagueStub, Player, Team
 from bot_daily_analysis import (
+    Config,
+    _best_bench_swap,
+    _best_bench_swap_np,
     export_current_team_rosters,
     export_free_agents,
     export_upcoming_pro_schedule,
     export_league_settings,
     export_matchups,
     export_rosters,
+    recommend_start_sit,
+    recommend_trades,
+    write_workbook,
 )
 
 
-class Player:
-    def __init__(self, player_id: int, name: str, slot: str, position: str = "QB"):
-        self.playerId = player_id
-        self.name = name
-        self.position = position
-        self.slot_position = slot
-        self.proTeam = "TEAM"
-        self.projected_points = 0
-        self.points = 0
-        self.injuryStatus = "ACTIVE"
-        self.percent_owned = 0
-        self.percent_started = 0
-        self.eligibleSlots = [position, "OP", "BE"]
-
-
-class Team:
-    def __init__(self, team_id: int, team_name: str, lineup):
-        self.team_id = team_id
-        self.team_name = team_name
-        # Simulate bug where team.roster misses bench players
-        self.roster = [p for p in lineup if p.slot_position != "BE"]
-
-
-class BoxScore:
-    def __init__(self, home_team, away_team, home_lineup, away_lineup, home_score=0, away_score=0):
-        self.home_team = home_team
-        self.away_team = away_team
-        self.home_lineup = home_lineup
-        self.away_lineup = away_lineup
-        self.home_score = home_score
-        self.away_score = away_score
-
-
-class LeagueStub:
-    def __init__(self):
-        self.current_week = 7
-        self._team_a_lineup = [
-            Player(1, "Starter A1", "QB"),
-            Player(2, "Bench A1", "BE"),
-        ]
-        self._team_b_lineup = [
-            Player(3, "Starter B1", "RB"),
-            Player(4, "Bench B1", "BE"),
-        ]
-        self.teams = [
-            Team(1, "Team A", self._team_a_lineup),
-            Team(2, "Team B", self._team_b_lineup),
-        ]
-        self._box = BoxScore(
-            self.teams[0], self.teams[1], self._team_a_lineup, self._team_b_lineup
-        )
-        self._fa = {
-            "QB": [Player(10, "FA QB", "BE")],
-            "RB": [Player(11, "FA RB", "BE", position="RB")],
-        }
-
-    def box_scores(self, week=None):
-        return [self._box]
-
-    def free_agents(self, size: int, position: str):
-        return self._fa.get(position, [])
-
-    def _get_all_pro_schedule(self):
-        now = datetime.now(tz.gettz("America/New_York"))
-        past = int((now - timedelta(days=1)).timestamp() * 1000)
-        future = int((now + timedelta(days=1)).timestamp() * 1000)
-        return {
-            1: {
-                "1": [
-                    {"gameId": 1, "date": past, "homeProTeamId": 1, "awayProTeamId": 2},
-                    {"gameId": 2, "date": future, "homeProTeamId": 3, "awayProTeamId": 4},
-                ]
-            },
-            2: {"1": [{"gameId": 2, "date": future, "homeProTeamId": 3, "awayProTeamId": 4}]},
-        }
-
-
-def test_export_current_team_rosters_includes_bench_and_week(tmp_path):
-    league = LeagueStub()
+def test_export_current_team_rosters_includes_bench_and_week(league, tmp_path):
     df = export_current_team_rosters(league, tmp_path)
     names = df["name"].tolist()
     assert "Bench A1" in names
@@ -102,14 +35,17 @@ def test_export_current_team_rosters_includes_bench_and_week(tmp_path):
     assert set(df["week"]) == {league.current_week}
 
 
-def test_export_free_agents_has_week(tmp_path):
-    league = LeagueStub()
+def test_export_free_agents_has_week(league, tmp_path):
     df = export_free_agents(league, tmp_path, pool_size=5, positions=["QB", "RB"])
     assert set(df["week"]) == {league.current_week}
 
 
-def test_export_upcoming_pro_schedule_filters_and_dedupes(tmp_path):
-    league = LeagueStub()
+def test_export_free_agents_keeps_position_order_with_one_worker(league, tmp_path):
+    df = export_free_agents(league, tmp_path, pool_size=5, positions=["RB", "QB", "K"], max_workers=1)
+    assert df["fa_position"].tolist() == ["RB", "QB"]
+
+
+def test_export_upcoming_pro_schedule_filters_and_dedupes(league, tmp_path):
     df = export_upcoming_pro_schedule(league, tmp_path)
     assert df["game_id"].tolist() == [2]
     assert df["home_team_id"].tolist() == [3]
@@ -135,8 +71,7 @@ def test_export_league_settings_writes_key_value(tmp_path):
     assert out_file.exists()
 
 
-def test_matchups_and_rosters_export_current_files(tmp_path):
-    league = LeagueStub()
+def test_matchups_and_rosters_export_current_files(league, tmp_path):
     df_m = export_matchups(league, tmp_path, None)
     df_r = export_rosters(league, tmp_path, None)
     assert (tmp_path / "current_matchups.csv").exists()
@@ -144,3 +79,137 @@ def test_matchups_and_rosters_export_current_files(tmp_path):
     assert set(df_m["week"]) == {league.current_week}
     assert set(df_r["week"]) == {league.current_week}
 
+
+def _config(tmp_path):
+    return Config(
+        league_id=1,
+        season_year=2025,
+        scoring_period=None,
+        my_team_id=1,
+        espn_s2=None,
+        swid=None,
+        out_dir=str(tmp_path),
+        xlsx_path=str(tmp_path / "league_export.xlsx"),
+        start_sit_threshold=1.5,
+        per_pos_thresholds={},
+        lock_positions=[],
+        free_agent_pool_size=5,
+        positions=["QB"],
+        projection_mode="league",
+    )
+
+
+def test_box_scores_fetched_once_per_week(tmp_path):
+    class CountingLeague(LeagueStub):
+        def __init__(self):
+            super().__init__()
+            self.box_score_calls = 0
+
+        def box_scores(self, week=None):
+            self.box_score_calls += 1
+            return super().box_scores(week)
+
+    league = CountingLeague()
+    cfg = _config(tmp_path)
+    export_matchups(league, tmp_path, league.current_week)
+    export_rosters(league, tmp_path, None)
+    export_current_team_rosters(league, tmp_path)
+    recommend_start_sit(league, cfg)
+    recommend_trades(league, cfg)
+    assert league.box_score_calls == 1
+
+
+def test_numba_bench_swap_matches_numpy_fallback():
+    pytest.importorskip("numba")
+    assert _best_bench_swap is not _best_bench_swap_np
+
+    rng = np.random.default_rng(0)
+    cases = [
+        np.zeros((3, 0), dtype=bool),
+        np.zeros((0, 4), dtype=bool),
+        np.zeros((3, 4), dtype=bool),
+    ]
+    cases += [rng.random((rng.integers(0, 6), rng.integers(0, 8))) < 0.4 for _ in range(500)]
+    for elig in cases:
+        # Small integer projections so ties are common.
+        bench_proj = rng.integers(0, 4, elig.shape[1]).astype(np.float64)
+        expected = _best_bench_swap_np(elig, bench_proj)
+        got = _best_bench_swap(elig, bench_proj)
+        assert got.tolist() == expected.tolist()
+
+
+def test_recommend_trades_one_offer_per_give_position(tmp_path):
+    def player(pid, name, slot, position, proj):
+        p = Player(pid, name, slot, position=position)
+        p.projected_points = proj
+        return p
+
+    # We are deep at RB/WR, the opponent at QB/TE.
+    mine = [
+        player(1, "My RB", "RB", "RB", 20),
+        player(2, "My WR", "WR", "WR", 20),
+        player(3, "My QB", "QB", "QB", 5),
+        player(4, "My TE", "TE", "TE", 5),
+        player(5, "My RB2", "BE", "RB", 10),
+        player(6, "My WR2", "BE", "WR", 10),
+    ]
+    theirs = [
+        player(11, "Opp RB", "RB", "RB", 5),
+        player(12, "Opp WR", "WR", "WR", 5),
+        player(13, "Opp QB", "QB", "QB", 20),
+        player(14, "Opp TE", "TE", "TE", 20),
+        player(15, "Opp QB2", "BE", "QB", 10),
+        player(16, "Opp TE2", "BE", "TE", 10),
+    ]
+
+    class TradeLeague(LeagueStub):
+        def __init__(self):
+            super().__init__()
+            self.teams = [Team(1, "Us", mine), Team(2, "Them", theirs)]
+            self._box = BoxScore(self.teams[0], self.teams[1], mine, theirs)
+
+    trades = recommend_trades(TradeLeague(), _config(tmp_path))
+    # Each surplus position is offered once, for the first deficit position
+    # in trade order (QB before TE).
+    assert [(t["send_player"], t["receive_player"]) for t in trades] == [
+        ("My RB2 (RB)", "Opp QB2 (QB)"),
+        ("My WR2 (WR)", "Opp QB2 (QB)"),
+    ]
+    assert {t["trade_with_team"] for t in trades} == {"Them"}
+
+
+def test_export_upcoming_pro_schedule_skips_bad_first_listing(tmp_path):
+    future = int((datetime.now(timezone.utc) + timedelta(days=2)).timestamp() * 1000)
+
+    class BadDateLeague(LeagueStub):
+        def _get_all_pro_schedule(self):
+            return {
+                1: {"3": [{"gameId": 9, "date": "not a date", "homeProTeamId": 3, "awayProTeamId": 4}]},
+                2: {"3": [{"gameId": 9, "date": future, "homeProTeamId": 3, "awayProTeamId": 4}]},
+            }
+
+    df = export_upcoming_pro_schedule(BadDateLeague(), tmp_path)
+    assert df["game_id"].tolist() == [9]
+
+
+def test_write_workbook_stringifies_container_settings(tmp_path):
+    class SettingsStub:
+        def __init__(self):
+            self.team_count = 8
+            self.position_slot_counts = {"QB": 1}
+            self.matchup_periods = [1, 2]
+            self.scoring_format = ({"abbr": "PY"},)
+
+    class LeagueWithSettings(LeagueStub):
+        def __init__(self):
+            super().__init__()
+            self.settings = SettingsStub()
+
+    df = export_league_settings(LeagueWithSettings(), tmp_path)
+    xlsx_path = tmp_path / "league_export.xlsx"
+    write_workbook(str(xlsx_path), {"league_settings": df})
+
+    with zipfile.ZipFile(xlsx_path) as zf:
+        xml = "".join(zf.read(n).decode("utf-8") for n in zf.namelist() if n.startswith("xl/"))
+    for text in ("{'QB': 1}", "[1, 2]", "({'abbr': 'PY'},)"):
+        assert html.escape(text, quote=False) in xml
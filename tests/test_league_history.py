@@ -0,0 +1,223 @@
+import csv
+import io
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from espn_extractor import league_history as lh
+
+
+class FakeLeague:
+    """Stands in for espn_api's League; counts fetches."""
+
+    fetches = 0
+    teams_per_league = 2
+
+    def __init__(self, league_id, year, **kwargs):
+        self.year = year
+
+    def fetch_league(self):
+        FakeLeague.fetches += 1
+        self.teams = [
+            SimpleNamespace(owner=f"Owner {i}", team_name=f"Team {i}", wins=i, losses=1, points_for=1.5 * i)
+            for i in range(FakeLeague.teams_per_league)
+        ]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(lh, "_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("ESPN_EXTRACTOR_CACHE_DIR", raising=False)
+    lh._load_cached_rows.cache_clear()
+    FakeLeague.fetches = 0
+    FakeLeague.teams_per_league = 2
+    return tmp_path / "cache"
+
+
+def _fetch(year):
+    return lh._fetch_season(year, league_cls=FakeLeague, league_id=1, espn_s2=None, swid=None, debug=False)
+
+
+def _freeze_time(monkeypatch, when):
+    monkeypatch.setattr(lh, "time", SimpleNamespace(time=lambda: when.timestamp()))
+
+
+def _set_mtime(year, when):
+    ts = when.timestamp()
+    os.utime(lh._cache_path(1, year), (ts, ts))
+
+
+def test_season_cache_miss_fetches_and_writes(cache_dir):
+    year, rows, exc = _fetch(2020)
+    assert exc is None and len(rows) == 2
+    assert FakeLeague.fetches == 1
+    assert os.path.exists(lh._cache_path(1, 2020))
+
+
+def test_season_cache_hit_skips_fetch(cache_dir, monkeypatch):
+    _, rows, _ = _fetch(2020)
+    _set_mtime(2020, datetime(2021, 3, 1))
+    _freeze_time(monkeypatch, datetime(2024, 9, 1))
+    _, cached, _ = _fetch(2020)
+    assert FakeLeague.fetches == 1
+    assert list(cached) == list(rows)
+
+
+def test_current_season_cache_expires(cache_dir, monkeypatch):
+    _fetch(2025)
+    _set_mtime(2025, datetime(2025, 11, 1, 12, 0))
+    _freeze_time(monkeypatch, datetime(2025, 11, 1, 12, 4))
+    _fetch(2025)
+    assert FakeLeague.fetches == 1
+    _freeze_time(monkeypatch, datetime(2025, 11, 1, 12, 6))
+    _fetch(2025)
+    assert FakeLeague.fetches == 2
+
+
+def test_mid_season_cache_not_promoted_in_january(cache_dir, monkeypatch):
+    # Written during the season; the calendar year has since rolled over but
+    # the playoffs may still be running.
+    _fetch(2025)
+    _set_mtime(2025, datetime(2025, 12, 20))
+    _freeze_time(monkeypatch, datetime(2026, 1, 10))
+    _fetch(2025)
+    assert FakeLeague.fetches == 2
+    # Still not final long afterwards, since the file predates the cutoff.
+    _set_mtime(2025, datetime(2026, 1, 10))
+    _freeze_time(monkeypatch, datetime(2026, 6, 1))
+    _fetch(2025)
+    assert FakeLeague.fetches == 3
+
+
+def test_empty_season_is_not_cached(cache_dir):
+    FakeLeague.teams_per_league = 0
+    _, rows, exc = _fetch(2020)
+    assert exc is None and rows == []
+    assert not os.path.exists(lh._cache_path(1, 2020))
+
+
+def _final_cache(monkeypatch, year):
+    _set_mtime(year, datetime(year + 1, 3, 1))
+    _freeze_time(monkeypatch, datetime(year + 4, 9, 1))
+
+
+def test_cache_for_other_headers_is_refetched(cache_dir, monkeypatch):
+    _fetch(2020)
+    path = lh._cache_path(1, 2020)
+    with open(path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    data["headers"] = data["headers"][:-1]
+    data["rows"] = [row[:-1] for row in data["rows"]]
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh)
+    _final_cache(monkeypatch, 2020)
+
+    _, rows, _ = _fetch(2020)
+    assert FakeLeague.fetches == 2
+    assert all(len(row) == len(lh._HEADERS) for row in rows)
+
+
+def test_cache_rows_of_wrong_length_are_rejected(cache_dir, monkeypatch):
+    _fetch(2020)
+    path = lh._cache_path(1, 2020)
+    with open(path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    data["rows"][0] = data["rows"][0][:-1]
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh)
+    _final_cache(monkeypatch, 2020)
+
+    _fetch(2020)
+    assert FakeLeague.fetches == 2
+
+
+def test_cache_disabled_by_empty_env(cache_dir, monkeypatch):
+    monkeypatch.setenv("ESPN_EXTRACTOR_CACHE_DIR", "")
+    _fetch(2020)
+    _fetch(2020)
+    assert FakeLeague.fetches == 2
+    assert not cache_dir.exists()
+
+
+def test_cache_dir_from_env(cache_dir, tmp_path, monkeypatch):
+    monkeypatch.setenv("ESPN_EXTRACTOR_CACHE_DIR", str(tmp_path / "elsewhere"))
+    _fetch(2020)
+    assert (tmp_path / "elsewhere" / "1" / "2020.json").exists()
+    assert not cache_dir.exists()
+
+
+def test_failed_cache_write_leaves_no_temp_file(cache_dir, monkeypatch):
+    def failing_dump(obj, fh, **kwargs):
+        fh.write("[")
+        raise ValueError("boom")
+
+    monkeypatch.setattr(lh.json, "dump", failing_dump)
+    _, rows, exc = _fetch(2020)
+    assert exc is None and len(rows) == 2
+    assert list(cache_dir.rglob("*")) == [cache_dir / "1"]
+
+
+def test_arrow_output_parses_to_same_rows(tmp_path):
+    pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+
+    rows = [
+        (f"Owner, {i}", 2000 + i % 20, f'Team "{i}"', i % 14, 13 - i % 14, 0, i % 12 + 1,
+         1000.5 + i, 990.25, i % 30, i % 3, i % 30, i % 5, "WIN" if i % 2 else "LOSS", i % 12 + 1)
+        for i in range(lh._ARROW_MIN_ROWS + 1)
+    ]
+    columns = {h: list(col) for h, col in zip(lh._HEADERS, zip(*rows))}
+    arrow_path, csv_path = tmp_path / "arrow.csv", tmp_path / "stdlib.csv"
+
+    assert lh._write_columns(str(arrow_path), "|", columns, use_arrow=True) == len(rows)
+    assert lh._write_rows(str(csv_path), "|", rows) == len(rows)
+    pd.testing.assert_frame_equal(pd.read_csv(arrow_path, sep="|"), pd.read_csv(csv_path, sep="|"))
+
+
+def _csv_writer_output(delimiter):
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf, delimiter=delimiter)
+    writer.writerow(lh._HEADERS)
+    writer.writerows([row[h] for h in lh._HEADERS] for row in lh._SAMPLE_HISTORY_2018)
+    return buf.getvalue().encode("utf-8")
+
+
+@pytest.mark.parametrize("delimiter", [",", "|"])
+def test_offline_fixture_matches_csv_writer(tmp_path, delimiter):
+    out = tmp_path / "history.csv"
+    lh.extract_team_records(lh._ConfigLike(1, 2018, 2018, str(out), delimiter), test_mode=True)
+    assert out.read_bytes() == _csv_writer_output(delimiter)
+
+
+def test_open_atomic_failure_keeps_original(tmp_path):
+    out = tmp_path / "history.csv"
+    out.write_text("original")
+    with pytest.raises(RuntimeError):
+        with lh._open_atomic(str(out)) as fh:
+            fh.write("partial")
+            raise RuntimeError("boom")
+    assert out.read_text() == "original"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_offline_fixture_rewritten_only_when_changed(tmp_path):
+    out = tmp_path / "history.csv"
+    config = lh._ConfigLike(1, 2018, 2018, str(out), "|")
+    lh.extract_team_records(config, test_mode=True)
+    os.utime(out, ns=(1_000_000_000, 1_000_000_000))
+
+    lh.extract_team_records(config, test_mode=True)
+    assert out.stat().st_mtime_ns == 1_000_000_000
+
+    out.write_bytes(out.read_bytes().replace(b"Team 1", b"Team X"))
+    os.utime(out, ns=(1_000_000_000, 1_000_000_000))
+    lh.extract_team_records(config, test_mode=True)
+    assert out.stat().st_mtime_ns != 1_000_000_000
+    assert out.read_bytes() == _csv_writer_output("|")